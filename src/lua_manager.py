@@ -25,17 +25,43 @@ SCRIPTS_PATH_V2 = YIMMENUV2_SCRIPTS_DIR
 DISABLED_SCRIPTS_PATH_V2 = YIMMENUV2_DISABLED_SCRIPTS_DIR
 
 
-def _get_lua_files(directory: str) -> List[str]:
-    """Helper function to find all .lua files in a directory."""
-    if not os.path.isdir(directory):
+# Single source of truth for version dispatch: version -> (scripts, disabled)
+_PATHS: Dict[str, tuple] = {
+    "v1": (SCRIPTS_PATH, DISABLED_SCRIPTS_PATH),
+    "v2": (SCRIPTS_PATH_V2, DISABLED_SCRIPTS_PATH_V2),
+}
+
+_PATH_DICTS: Dict[str, Dict[str, str]] = {
+    "v1": {
+        "appdata_dir": YIM_FOLDER_PATH,
+        "scripts_dir": SCRIPTS_PATH,
+        "disabled_dir": DISABLED_SCRIPTS_PATH,
+    },
+    "v2": {
+        "appdata_dir": YIMV2_FOLDER_PATH,
+        "scripts_dir": SCRIPTS_PATH_V2,
+        "disabled_dir": DISABLED_SCRIPTS_PATH_V2,
+    },
+}
+
+# Cache of get_scripts results keyed by version, validated against the
+# mtimes of both directories so repeated UI polling skips the re-scan.
+_scripts_cache: Dict[str, tuple] = {}
+
+
+def _get_lua_display_names(directory: str) -> List[str]:
+    """Helper function to find all .lua files in a directory, returning the
+    sorted names with the '.lua' suffix stripped for display."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                e.name[:-4]
+                for e in it
+                if e.name.endswith(".lua") and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
         return []
 
-    return [
-        f
-        for f in os.listdir(directory)
-        if f.endswith(".lua") and os.path.isfile(os.path.join(directory, f))
-    ]
-
 
 def get_scripts(version: str = "v1") -> Dict[str, List[str]]:
     """
@@ -45,29 +71,48 @@ def get_scripts(version: str = "v1") -> Dict[str, List[str]]:
     Args:
         version: "v1" for YimMenu (legacy), "v2" for YimMenuV2 (enhanced)
     """
-    if version == "v2":
-        scripts_dir = SCRIPTS_PATH_V2
-        disabled_dir = DISABLED_SCRIPTS_PATH_V2
-        logger.debug(f"Getting scripts for YimMenuV2 from {scripts_dir}")
-    else:
-        scripts_dir = SCRIPTS_PATH
-        disabled_dir = DISABLED_SCRIPTS_PATH
-        logger.debug(f"Getting scripts for YimMenu v1 from {scripts_dir}")
-    
-    # Ensure directories exist
-    os.makedirs(scripts_dir, exist_ok=True)
-    os.makedirs(disabled_dir, exist_ok=True)
+    scripts_dir, disabled_dir = _PATHS.get(version, _PATHS["v1"])
+    logger.debug(f"Getting scripts for YimMenu {version} from {scripts_dir}")
 
-    enabled_scripts_full = _get_lua_files(scripts_dir)
-    disabled_scripts_full = _get_lua_files(disabled_dir)
-
-    enabled_display = [s.removesuffix(".lua") for s in sorted(enabled_scripts_full)]
-    disabled_display = [s.removesuffix(".lua") for s in sorted(disabled_scripts_full)]
+    # Two stat() calls validate the cache; only re-scan when a directory changed.
+    # paths.py materializes these directories on first attribute access, which
+    # this module's own imports trigger, so they normally exist by now; recreate
+    # only if something deleted them behind our back.
+    try:
+        scripts_mtime = os.stat(scripts_dir).st_mtime_ns
+        disabled_mtime = os.stat(disabled_dir).st_mtime_ns
+    except FileNotFoundError:
+        os.makedirs(disabled_dir, exist_ok=True)
+        scripts_mtime = os.stat(scripts_dir).st_mtime_ns
+        disabled_mtime = os.stat(disabled_dir).st_mtime_ns
+
+    cached = _scripts_cache.get(version)
+    if cached is not None and cached[0] == scripts_mtime and cached[1] == disabled_mtime:
+        return cached[2]
+
+    # One scan of scripts/, classifying inline: the disabled/ folder is
+    # nested inside it, so skip that entry explicitly rather than relying
+    # on the suffix filter to reject it.
+    try:
+        with os.scandir(scripts_dir) as it:
+            enabled_display = sorted(
+                e.name[:-4]
+                for e in it
+                if e.name != "disabled"
+                and e.name.endswith(".lua")
+                and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        enabled_display = []
+
+    disabled_display = _get_lua_display_names(disabled_dir)
 
     logger.debug(f"Found enabled scripts ({version}): {enabled_display}")
     logger.debug(f"Found disabled scripts ({version}): {disabled_display}")
 
-    return {"enabled": enabled_display, "disabled": disabled_display}
+    result = {"enabled": enabled_display, "disabled": disabled_display}
+    _scripts_cache[version] = (scripts_mtime, disabled_mtime, result)
+    return result
 
 
 def enable_script(filename: str, version: str = "v1") -> bool:
@@ -78,31 +123,29 @@ def enable_script(filename: str, version: str = "v1") -> bool:
         filename: Name of the script without .lua extension
         version: "v1" for YimMenu (legacy), "v2" for YimMenuV2 (enhanced)
     """
-    if version == "v2":
-        scripts_dir = SCRIPTS_PATH_V2
-        disabled_dir = DISABLED_SCRIPTS_PATH_V2
-    else:
-        scripts_dir = SCRIPTS_PATH
-        disabled_dir = DISABLED_SCRIPTS_PATH
-    
+    scripts_dir, disabled_dir = _PATHS.get(version, _PATHS["v1"])
+
     actual_filename = f"{filename}.lua"
 
     src = os.path.join(disabled_dir, actual_filename)
     dest = os.path.join(scripts_dir, actual_filename)
 
-    if not os.path.exists(src):
+    try:
+        try:
+            os.replace(src, dest)
+        except FileNotFoundError:
+            # Either the source is gone or the destination directory was
+            # removed behind our back; recreating the directory disambiguates.
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            os.replace(src, dest)
+        _scripts_cache.pop(version, None)
+        logger.info(f"Enabled script {actual_filename} for {version}")
+        return True
+    except FileNotFoundError:
         logger.error(
             f"Cannot enable script '{actual_filename}' for {version}, it does not exist in the disabled folder."
         )
         return False
-
-    try:
-        # Ensure destination directory exists
-        os.makedirs(os.path.dirname(dest), exist_ok=True)
-        
-        shutil.move(src, dest)
-        logger.info(f"Enabled script {actual_filename} for {version}")
-        return True
     except (IOError, OSError) as e:
         logger.exception(f"Error enabling script {actual_filename} for {version}: {e}")
         return False
@@ -116,31 +159,29 @@ def disable_script(filename: str, version: str = "v1") -> bool:
         filename: Name of the script without .lua extension
         version: "v1" for YimMenu (legacy), "v2" for YimMenuV2 (enhanced)
     """
-    if version == "v2":
-        scripts_dir = SCRIPTS_PATH_V2
-        disabled_dir = DISABLED_SCRIPTS_PATH_V2
-    else:
-        scripts_dir = SCRIPTS_PATH
-        disabled_dir = DISABLED_SCRIPTS_PATH
-    
+    scripts_dir, disabled_dir = _PATHS.get(version, _PATHS["v1"])
+
     actual_filename = f"{filename}.lua"
 
     src = os.path.join(scripts_dir, actual_filename)
     dest = os.path.join(disabled_dir, actual_filename)
 
-    if not os.path.exists(src):
+    try:
+        try:
+            os.replace(src, dest)
+        except FileNotFoundError:
+            # Either the source is gone or the destination directory was
+            # removed behind our back; recreating the directory disambiguates.
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            os.replace(src, dest)
+        _scripts_cache.pop(version, None)
+        logger.info(f"Disabled script {actual_filename} for {version}")
+        return True
+    except FileNotFoundError:
         logger.error(
             f"Cannot disable script '{actual_filename}' for {version}, it does not exist in the scripts folder."
         )
         return False
-
-    try:
-        # Ensure destination directory exists
-        os.makedirs(os.path.dirname(dest), exist_ok=True)
-        
-        shutil.move(src, dest)
-        logger.info(f"Disabled script {actual_filename} for {version}")
-        return True
     except (IOError, OSError) as e:
         logger.exception(f"Error disabling script {actual_filename} for {version}: {e}")
         return False
@@ -189,18 +230,7 @@ def get_script_paths(version: str = "v1") -> Dict[str, str]:
     Returns:
         Dictionary with paths
     """
-    if version == "v2":
-        return {
-            "appdata_dir": YIMV2_FOLDER_PATH,
-            "scripts_dir": SCRIPTS_PATH_V2,
-            "disabled_dir": DISABLED_SCRIPTS_PATH_V2
-        }
-    else:
-        return {
-            "appdata_dir": YIM_FOLDER_PATH,
-            "scripts_dir": SCRIPTS_PATH,
-            "disabled_dir": DISABLED_SCRIPTS_PATH
-        }
+    return _PATH_DICTS.get(version, _PATH_DICTS["v1"])
 
 
 # Function to copy scripts between versions
@@ -222,34 +252,29 @@ def copy_script_between_versions(filename: str, from_version: str, to_version: s
         return False
     
     actual_filename = f"{filename}.lua"
-    
-    # Get source paths
-    from_paths = get_script_paths(from_version)
-    if enabled:
-        src_dir = from_paths["scripts_dir"]
-    else:
-        src_dir = from_paths["disabled_dir"]
+
+    # Select source/destination straight from the dispatch table
+    which = 0 if enabled else 1
+    src_dir = _PATHS[from_version][which]
+    dest_dir = _PATHS[to_version][which]
     src = os.path.join(src_dir, actual_filename)
-    
-    # Get destination paths
-    to_paths = get_script_paths(to_version)
-    if enabled:
-        dest_dir = to_paths["scripts_dir"]
-    else:
-        dest_dir = to_paths["disabled_dir"]
     dest = os.path.join(dest_dir, actual_filename)
-    
+
     # Check if source exists
     if not os.path.exists(src):
         logger.error(f"Script '{actual_filename}' not found in {from_version}")
         return False
     
     try:
-        # Ensure destination directory exists
-        os.makedirs(os.path.dirname(dest), exist_ok=True)
-        
-        # Copy the file
-        shutil.copy2(src, dest)
+        # Copy the file contents only; the copy is YMU-managed on both
+        # sides, so preserving source mtimes/permissions buys nothing
+        try:
+            shutil.copyfile(src, dest)
+        except FileNotFoundError:
+            # Destination directory was removed behind our back; recreate it
+            os.makedirs(dest_dir, exist_ok=True)
+            shutil.copyfile(src, dest)
+        _scripts_cache.pop(to_version, None)
         logger.info(f"Copied script '{actual_filename}' from {from_version} to {to_version}")
         return True
         
@@ -29,11 +29,9 @@ if USERPROFILE is None:
 
 
 # ========== YMU Application Paths ==========
-YMU_APPDATA_DIR = _create_path(os.path.join(APPDATA_PATH, "YMU"))
-YMU_DLL_DIR = _create_path(os.path.join(YMU_APPDATA_DIR, "dll"))
-YMU_LANG_DIR = _create_path(os.path.join(YMU_APPDATA_DIR, "lang"))
-YMU_LOG_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "ymu.log")
-YMU_CONFIG_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "config.json")
+_YMU_APPDATA_DIR = os.path.abspath(os.path.join(APPDATA_PATH, "YMU"))
+YMU_LOG_FILE_PATH = os.path.join(_YMU_APPDATA_DIR, "ymu.log")
+YMU_CONFIG_FILE_PATH = os.path.join(_YMU_APPDATA_DIR, "config.json")
 
 # ========== GTAV Game Directory Paths ==========
 GTAV_DOCUMENTS_DIR = os.path.join(USERPROFILE, "Documents", "Rockstar Games", "GTA V")
@@ -43,16 +41,44 @@ GTAV_ENHANCED_DOCUMENTS_DIR = os.path.join(USERPROFILE, "Documents", "Rockstar G
 # Use os.path.exists() to check before using
 
 # ========== YimMenu (Legacy v1) Paths ==========
-YIMMENU_APPDATA_DIR = _create_path(os.path.join(APPDATA_PATH, "YimMenu"))
-YIMMENU_SCRIPTS_DIR = _create_path(os.path.join(YIMMENU_APPDATA_DIR, "scripts"))
-YIMMENU_DISABLED_SCRIPTS_DIR = _create_path(os.path.join(YIMMENU_SCRIPTS_DIR, "disabled"))
-YIMMENU_SETTINGS_FILE_PATH = os.path.join(YIMMENU_APPDATA_DIR, "settings.json")
+_YIMMENU_APPDATA_DIR = os.path.abspath(os.path.join(APPDATA_PATH, "YimMenu"))
+YIMMENU_SETTINGS_FILE_PATH = os.path.join(_YIMMENU_APPDATA_DIR, "settings.json")
 
 # ========== YimMenuV2 (Enhanced) Paths ==========
-YIMMENUV2_APPDATA_DIR = _create_path(os.path.join(APPDATA_PATH, "YimMenuV2"))
-YIMMENUV2_SCRIPTS_DIR = _create_path(os.path.join(YIMMENUV2_APPDATA_DIR, "scripts"))
-YIMMENUV2_DISABLED_SCRIPTS_DIR = _create_path(os.path.join(YIMMENUV2_SCRIPTS_DIR, "disabled"))
-YIMMENUV2_SETTINGS_FILE_PATH = os.path.join(YIMMENUV2_APPDATA_DIR, "settings.json")
+_YIMMENUV2_APPDATA_DIR = os.path.abspath(os.path.join(APPDATA_PATH, "YimMenuV2"))
+YIMMENUV2_SETTINGS_FILE_PATH = os.path.join(_YIMMENUV2_APPDATA_DIR, "settings.json")
+
+# ========== Lazily Created Directories ==========
+# Directory constants are created on first attribute access (PEP 562
+# module __getattr__) instead of unconditionally at import time, so a
+# caller that only touches v1 paths never creates the v2 tree.
+_LAZY_DIRS = {
+    "YMU_APPDATA_DIR": _YMU_APPDATA_DIR,
+    "YMU_DLL_DIR": os.path.join(_YMU_APPDATA_DIR, "dll"),
+    "YMU_LANG_DIR": os.path.join(_YMU_APPDATA_DIR, "lang"),
+    "YIMMENU_APPDATA_DIR": _YIMMENU_APPDATA_DIR,
+    "YIMMENU_SCRIPTS_DIR": os.path.join(_YIMMENU_APPDATA_DIR, "scripts"),
+    "YIMMENU_DISABLED_SCRIPTS_DIR": os.path.join(_YIMMENU_APPDATA_DIR, "scripts", "disabled"),
+    "YIMMENUV2_APPDATA_DIR": _YIMMENUV2_APPDATA_DIR,
+    "YIMMENUV2_SCRIPTS_DIR": os.path.join(_YIMMENUV2_APPDATA_DIR, "scripts"),
+    "YIMMENUV2_DISABLED_SCRIPTS_DIR": os.path.join(_YIMMENUV2_APPDATA_DIR, "scripts", "disabled"),
+}
+
+
+def __getattr__(name: str) -> str:
+    """Creates a lazily defined directory on first access and caches it."""
+    try:
+        path = _LAZY_DIRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = path = _create_path(path)
+    return path
+
+
+def _get_dir(name: str) -> str:
+    """Resolves a lazily created directory from inside this module, where
+    module __getattr__ is not consulted for global lookups."""
+    return globals().get(name) or __getattr__(name)
 
 # ========== Helper Functions ==========
 def get_yimmenu_paths(version: str = "v1") -> dict:
@@ -67,16 +93,16 @@ def get_yimmenu_paths(version: str = "v1") -> dict:
     """
     if version.lower() == "v2":
         return {
-            "appdata_dir": YIMMENUV2_APPDATA_DIR,
-            "scripts_dir": YIMMENUV2_SCRIPTS_DIR,
-            "disabled_dir": YIMMENUV2_DISABLED_SCRIPTS_DIR,
+            "appdata_dir": _get_dir("YIMMENUV2_APPDATA_DIR"),
+            "scripts_dir": _get_dir("YIMMENUV2_SCRIPTS_DIR"),
+            "disabled_dir": _get_dir("YIMMENUV2_DISABLED_SCRIPTS_DIR"),
             "settings_file": YIMMENUV2_SETTINGS_FILE_PATH
         }
     else:
         return {
-            "appdata_dir": YIMMENU_APPDATA_DIR,
-            "scripts_dir": YIMMENU_SCRIPTS_DIR,
-            "disabled_dir": YIMMENU_DISABLED_SCRIPTS_DIR,
+            "appdata_dir": _get_dir("YIMMENU_APPDATA_DIR"),
+            "scripts_dir": _get_dir("YIMMENU_SCRIPTS_DIR"),
+            "disabled_dir": _get_dir("YIMMENU_DISABLED_SCRIPTS_DIR"),
             "settings_file": YIMMENU_SETTINGS_FILE_PATH
         }
 
@@ -145,9 +171,9 @@ def get_version_info() -> dict:
         "ymu_version": LOCAL_VERSION,
         "app_url": APP_URL,
         "user_agent": USER_AGENT,
-        "yimmenu_v1_path": YIMMENU_APPDATA_DIR,
-        "yimmenu_v2_path": YIMMENUV2_APPDATA_DIR,
-        "ymu_path": YMU_APPDATA_DIR,
+        "yimmenu_v1_path": _YIMMENU_APPDATA_DIR,
+        "yimmenu_v2_path": _YIMMENUV2_APPDATA_DIR,
+        "ymu_path": _YMU_APPDATA_DIR,
         "gtav_path": GTAV_DOCUMENTS_DIR,
         "gtav_enhanced_path": GTAV_ENHANCED_DOCUMENTS_DIR
     }
@@ -158,9 +184,9 @@ def print_paths() -> None:
     print("=" * 60)
     print("YMU Paths:")
     print("=" * 60)
-    print(f"YMU AppData: {YMU_APPDATA_DIR}")
-    print(f"YMU DLL Dir: {YMU_DLL_DIR}")
-    print(f"YMU Lang Dir: {YMU_LANG_DIR}")
+    print(f"YMU AppData: {_LAZY_DIRS['YMU_APPDATA_DIR']}")
+    print(f"YMU DLL Dir: {_LAZY_DIRS['YMU_DLL_DIR']}")
+    print(f"YMU Lang Dir: {_LAZY_DIRS['YMU_LANG_DIR']}")
     print(f"YMU Log File: {YMU_LOG_FILE_PATH}")
     print(f"YMU Config: {YMU_CONFIG_FILE_PATH}")
     print()
@@ -177,18 +203,18 @@ def print_paths() -> None:
     print("=" * 60)
     print("YimMenu (v1) Paths:")
     print("=" * 60)
-    print(f"AppData: {YIMMENU_APPDATA_DIR}")
-    print(f"Scripts: {YIMMENU_SCRIPTS_DIR}")
-    print(f"Disabled: {YIMMENU_DISABLED_SCRIPTS_DIR}")
+    print(f"AppData: {_LAZY_DIRS['YIMMENU_APPDATA_DIR']}")
+    print(f"Scripts: {_LAZY_DIRS['YIMMENU_SCRIPTS_DIR']}")
+    print(f"Disabled: {_LAZY_DIRS['YIMMENU_DISABLED_SCRIPTS_DIR']}")
     print(f"Settings: {YIMMENU_SETTINGS_FILE_PATH}")
     print()
     
     print("=" * 60)
     print("YimMenuV2 (v2) Paths:")
     print("=" * 60)
-    print(f"AppData: {YIMMENUV2_APPDATA_DIR}")
-    print(f"Scripts: {YIMMENUV2_SCRIPTS_DIR}")
-    print(f"Disabled: {YIMMENUV2_DISABLED_SCRIPTS_DIR}")
+    print(f"AppData: {_LAZY_DIRS['YIMMENUV2_APPDATA_DIR']}")
+    print(f"Scripts: {_LAZY_DIRS['YIMMENUV2_SCRIPTS_DIR']}")
+    print(f"Disabled: {_LAZY_DIRS['YIMMENUV2_DISABLED_SCRIPTS_DIR']}")
     print(f"Settings: {YIMMENUV2_SETTINGS_FILE_PATH}")
     print("=" * 60)
 
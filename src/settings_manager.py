@@ -1,8 +1,12 @@
 # settings_manager.py - Manages reading and writing to YimMenu's settings.json.
 import os
+import copy
 import json
+import time
+import atexit
 import logging
-import shutil
+import functools
+import threading
 from paths import YIMMENU_SETTINGS_FILE_PATH, YIMMENUV2_SETTINGS_FILE_PATH
 
 logger = logging.getLogger(__name__)
@@ -13,28 +17,72 @@ SETTINGS_FILE_PATHS = {
     "v2": YIMMENUV2_SETTINGS_FILE_PATH
 }
 
+# 缓存有效期（秒）：在此期间跳过mtime检查，避免每次读取都stat文件
+_CHECK_TTL = 0.1
+
+# 写入合并延迟（秒）：连续的setter调用只落盘一次
+_FLUSH_DELAY = 0.05
+
+# 默认设置的唯一来源；字节形式在模块加载时序列化一次，
+# 创建默认文件（v1和v2共用）时直接写入，无需再跑json.dump
+_DEFAULT_SETTINGS = {
+    "lua": {
+        "auto_reload_scripts": False,
+        "auto_reload_changed_scripts": False
+    },
+    "debug": {
+        "external_console": False
+    },
+    "theme": {
+        "light_mode": False
+    }
+}
+_DEFAULT_SETTINGS_JSON = json.dumps(_DEFAULT_SETTINGS, indent=4).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key_path: str) -> tuple:
+    """缓存键路径的拆分结果，热点调用只有少数固定的key_path"""
+    return tuple(key_path.split("."))
+
 class SettingsManager:
-    """管理YimMenu设置的单例类，确保两个版本的设置完全独立"""
-    
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SettingsManager, cls).__new__(cls)
-        return cls._instance
-    
+    """管理YimMenu设置的类，确保两个版本的设置完全独立
+
+    模块本身就是单例：请使用模块底部的 settings_manager 实例，
+    不需要再通过 __new__ 去重
+    """
+
+    # 热点getter的共享空字典，避免每次分配
+    _EMPTY: dict = {}
+
     def __init__(self):
-        if not self._initialized:
-            self._settings_cache = {
-                "v1": None,
-                "v2": None
-            }
-            self._last_modified = {
-                "v1": 0,
-                "v2": 0
-            }
-            self._initialized = True
+        self._settings_cache = {
+            "v1": None,
+            "v2": None
+        }
+        self._last_modified = {
+            "v1": 0,
+            "v2": 0
+        }
+        self._last_check = {
+            "v1": 0.0,
+            "v2": 0.0
+        }
+        # 每个版本一把锁，串行化读-改-写；读取方只在需要从文件
+        # 重读时才短暂加锁（RLock：setter持锁期间也会触发读取）
+        self._locks = {
+            "v1": threading.RLock(),
+            "v2": threading.RLock()
+        }
+        # 延迟写入状态：dirty标记 + 合并定时器
+        self._dirty = {
+            "v1": False,
+            "v2": False
+        }
+        self._timers = {
+            "v1": None,
+            "v2": None
+        }
     
     def _get_file_path(self, yim_version: str) -> str:
         """获取指定版本的设置文件路径"""
@@ -59,14 +107,16 @@ class SettingsManager:
             # 确保目录存在
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            
-            shutil.move(temp_file, file_path)
+            # 一次性写入序列化好的字节，避免json.dump的多次小写入
+            with open(temp_file, "wb") as f:
+                f.write(json.dumps(data, indent=4).encode("utf-8"))
+
+            # 临时文件与目标文件在同一目录，os.replace是原子的单个rename
+            os.replace(temp_file, file_path)
             
             # 更新缓存和修改时间
             self._settings_cache[version] = data
-            self._last_modified[version] = os.path.getmtime(file_path)
+            self._last_modified[version] = os.stat(file_path).st_mtime_ns
             
             logger.info(f"Successfully wrote to {file_path}")
             return True
@@ -78,25 +128,77 @@ class SettingsManager:
         """使用缓存获取设置，避免频繁读取文件"""
         version_key = "v2" if yim_version == "v2" else "v1"
         file_path = self._get_file_path(yim_version)
-        
-        # 如果文件不存在，返回空字典
-        if not os.path.exists(file_path):
-            return {}
-        
+
+        # 有未落盘的变更时缓存即是最新状态，绝不能从文件重读覆盖掉
+        if self._dirty[version_key]:
+            return self._settings_cache[version_key]
+
+        # 短时间内重复读取直接命中缓存，跳过mtime检查
+        # （自己的写入会更新缓存，所以只有外部写入者最多延迟_CHECK_TTL秒可见）
+        now = time.monotonic()
+        if (self._settings_cache[version_key] is not None and
+            now - self._last_check[version_key] < _CHECK_TTL):
+            return self._settings_cache[version_key]
+
         try:
-            # 检查文件是否已被修改
-            current_mtime = os.path.getmtime(file_path)
-            
-            # 如果缓存为空或文件已被修改，重新读取
-            if (self._settings_cache[version_key] is None or 
+            # 一次stat检查文件是否存在及是否已被修改
+            # （st_mtime_ns为整数，比较精确且无需分配浮点数）
+            current_mtime = os.stat(file_path).st_mtime_ns
+
+            # 如果缓存为空或文件已被修改，重新读取。重读会回写共享缓存，
+            # 必须加锁并在锁内复查dirty，否则可能覆盖掉并发setter刚存入
+            # 的脏缓存，导致其变更在落盘前丢失
+            if (self._settings_cache[version_key] is None or
                 self._last_modified[version_key] != current_mtime):
-                self._settings_cache[version_key] = self._read_json_safely(file_path)
-                self._last_modified[version_key] = current_mtime
-            
+                with self._locks[version_key]:
+                    if self._dirty[version_key]:
+                        return self._settings_cache[version_key]
+                    if (self._settings_cache[version_key] is None or
+                        self._last_modified[version_key] != current_mtime):
+                        self._settings_cache[version_key] = self._read_json_safely(file_path)
+                        self._last_modified[version_key] = current_mtime
+
+            self._last_check[version_key] = now
             return self._settings_cache[version_key]
         except OSError:
+            # 文件不存在（FileNotFoundError）或无法访问，返回空字典
             return {}
     
+    def _store_and_schedule_flush(self, version_key: str, data: dict) -> None:
+        """更新缓存并（重新）安排延迟落盘，合并短时间内的连续写入
+
+        调用方必须已持有对应版本的锁
+        """
+        self._settings_cache[version_key] = data
+        self._dirty[version_key] = True
+
+        timer = self._timers[version_key]
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(_FLUSH_DELAY, self._flush, args=(version_key,))
+        timer.daemon = True
+        timer.start()
+        self._timers[version_key] = timer
+
+    def _flush(self, version_key: str) -> bool:
+        """将指定版本的未落盘变更写入文件"""
+        with self._locks[version_key]:
+            if not self._dirty[version_key]:
+                return True
+            self._dirty[version_key] = False
+            self._timers[version_key] = None
+            file_path = SETTINGS_FILE_PATHS[version_key]
+            return self._write_json_safely(
+                file_path, self._settings_cache[version_key], version_key
+            )
+
+    def flush(self) -> bool:
+        """立即落盘所有未写入的变更（应用退出时调用）"""
+        success = True
+        for version_key in ("v1", "v2"):
+            success = self._flush(version_key) and success
+        return success
+
     def get_setting(self, key_path: str, default=None, yim_version: str = "v1"):
         """
         读取嵌套设置
@@ -107,8 +209,8 @@ class SettingsManager:
             yim_version: YimMenu版本，可选 "v1" 或 "v2"
         """
         data = self._get_settings_with_cache(yim_version)
-        
-        keys = key_path.split(".")
+
+        keys = _split_key(key_path)
         value = data
         try:
             for key in keys:
@@ -127,28 +229,61 @@ class SettingsManager:
             yim_version: YimMenu版本，可选 "v1" 或 "v2"
         """
         version_key = "v2" if yim_version == "v2" else "v1"
-        file_path = self._get_file_path(yim_version)
-        
-        # 获取当前设置
-        data = self._get_settings_with_cache(yim_version)
-        
-        # 遍历并设置嵌套键
-        keys = key_path.split(".")
-        d = data
-        try:
-            for i, key in enumerate(keys[:-1]):
-                if key not in d or not isinstance(d[key], dict):
-                    d[key] = {}
-                d = d[key]
-            
-            d[keys[-1]] = value
-        except Exception as e:
-            logger.error(f"Error traversing settings dict for {yim_version}: {e}")
-            return False
-        
-        # 写入文件并更新缓存
-        return self._write_json_safely(file_path, data, version_key)
-    
+
+        # 加锁串行化读-改-写，避免并发写入互相覆盖；
+        # 在快照副本上修改，缓存中的字典永不原地变更，读取方无需加锁
+        with self._locks[version_key]:
+            data = copy.deepcopy(self._get_settings_with_cache(yim_version))
+
+            # 遍历并设置嵌套键
+            keys = _split_key(key_path)
+            d = data
+            try:
+                for key in keys[:-1]:
+                    if key not in d or not isinstance(d[key], dict):
+                        d[key] = {}
+                    d = d[key]
+
+                d[keys[-1]] = value
+            except Exception as e:
+                logger.error(f"Error traversing settings dict for {yim_version}: {e}")
+                return False
+
+            # 更新缓存并延迟落盘，合并连续写入
+            self._store_and_schedule_flush(version_key, data)
+            return True
+
+    def set_settings(self, updates: dict, yim_version: str = "v1") -> bool:
+        """
+        批量写入多个嵌套设置，只写一次文件
+
+        Args:
+            updates: {key_path: value} 映射，如 {"lua.auto_reload_scripts": True}
+            yim_version: YimMenu版本，可选 "v1" 或 "v2"
+        """
+        version_key = "v2" if yim_version == "v2" else "v1"
+
+        # 加锁串行化读-改-写，在快照副本上应用所有变更后一次性写入
+        with self._locks[version_key]:
+            data = copy.deepcopy(self._get_settings_with_cache(yim_version))
+
+            try:
+                for key_path, value in updates.items():
+                    keys = _split_key(key_path)
+                    d = data
+                    for key in keys[:-1]:
+                        if key not in d or not isinstance(d[key], dict):
+                            d[key] = {}
+                        d = d[key]
+                    d[keys[-1]] = value
+            except Exception as e:
+                logger.error(f"Error traversing settings dict for {yim_version}: {e}")
+                return False
+
+            # 更新缓存并延迟落盘，合并连续写入
+            self._store_and_schedule_flush(version_key, data)
+            return True
+
     def ensure_settings_file_exists(self, yim_version: str = "v1"):
         """
         确保设置文件存在，如果不存在则创建一个默认的
@@ -159,23 +294,24 @@ class SettingsManager:
         file_path = self._get_file_path(yim_version)
         
         if not os.path.exists(file_path):
-            # 版本特定的默认设置
-            default_settings = {
-                "lua": {
-                    "auto_reload_scripts": False,
-                    "auto_reload_changed_scripts": False
-                },
-                "debug": {
-                    "external_console": False
-                },
-                "theme": {
-                    "light_mode": False
-                }
-            }
-            
-            # 创建默认设置文件
+            # 创建默认设置文件：直接写入预先序列化好的字节，
+            # 同样走临时文件+原子替换
             version_key = "v2" if yim_version == "v2" else "v1"
-            success = self._write_json_safely(file_path, default_settings, version_key)
+            with self._locks[version_key]:
+                temp_file = file_path + ".tmp"
+                try:
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    with open(temp_file, "wb") as f:
+                        f.write(_DEFAULT_SETTINGS_JSON)
+                    os.replace(temp_file, file_path)
+
+                    # 更新缓存和修改时间（深拷贝，避免共享默认字典）
+                    self._settings_cache[version_key] = copy.deepcopy(_DEFAULT_SETTINGS)
+                    self._last_modified[version_key] = os.stat(file_path).st_mtime_ns
+                    success = True
+                except OSError as e:
+                    logger.error(f"Failed to write settings file {file_path}: {e}")
+                    success = False
             if success:
                 logger.info(f"Created default settings file for YimMenu {yim_version} at {file_path}")
             else:
@@ -190,11 +326,14 @@ class SettingsManager:
         注意：这个方法只读取 auto_reload_changed_scripts 设置，
         与 auto_reload_scripts 完全独立
         """
-        return self.get_setting(
-            "lua.auto_reload_changed_scripts", 
-            default=False, 
-            yim_version=yim_version
-        )
+        # 热点路径：内联两次dict查找，跳过通用的键路径遍历；
+        # 文件由外部YimMenu进程写入，"lua"可能是null等非dict值，
+        # try/except在正常路径上零开销
+        data = self._get_settings_with_cache(yim_version)
+        try:
+            return data.get("lua", self._EMPTY).get("auto_reload_changed_scripts", False)
+        except AttributeError:
+            return False
     
     def set_auto_reload_changed_scripts(self, value: bool, yim_version: str = "v1") -> bool:
         """
@@ -213,11 +352,13 @@ class SettingsManager:
         """
         获取指定版本的 Auto-reload scripts 设置
         """
-        return self.get_setting(
-            "lua.auto_reload_scripts", 
-            default=False, 
-            yim_version=yim_version
-        )
+        # 热点路径：内联两次dict查找，跳过通用的键路径遍历；
+        # 同上，"lua"为非dict值时回退默认值而不是抛异常
+        data = self._get_settings_with_cache(yim_version)
+        try:
+            return data.get("lua", self._EMPTY).get("auto_reload_scripts", False)
+        except AttributeError:
+            return False
     
     def set_auto_reload_scripts(self, value: bool, yim_version: str = "v1") -> bool:
         """
@@ -276,6 +417,9 @@ class SettingsManager:
 # ===== 全局单例实例 =====
 settings_manager = SettingsManager()
 
+# 应用退出时落盘所有未写入的变更
+atexit.register(settings_manager.flush)
+
 # ===== 兼容性函数（保持接口一致） =====
 
 def get_setting(key_path: str, default=None, yim_version: str = "v1"):
@@ -297,10 +441,14 @@ def get_auto_reload_setting(yim_version: str = "v1") -> bool:
 
 def set_auto_reload_setting(value: bool, yim_version: str = "v1") -> bool:
     """兼容性函数，设置 Auto-reload 设置（注意：这个函数可能会同时设置两个值）"""
-    # 为了向后兼容，同时设置两个键
-    success1 = settings_manager.set_setting("lua.auto_reload_scripts", value, yim_version=yim_version)
-    success2 = settings_manager.set_setting("lua.auto_reload_changed_scripts", value, yim_version=yim_version)
-    return success1 and success2
+    # 为了向后兼容，同时设置两个键（批量写入，只写一次文件）
+    return settings_manager.set_settings(
+        {
+            "lua.auto_reload_scripts": value,
+            "lua.auto_reload_changed_scripts": value,
+        },
+        yim_version=yim_version,
+    )
 
 # ===== 独立功能函数 =====
 
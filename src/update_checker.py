@@ -1,11 +1,11 @@
-import release_service
+# 注意：requests（連帶 urllib3/ssl/charset_normalizer）很重，
+# 冷啟動導入要上百毫秒，推遲到第一次真正需要網絡時再導入
 import subprocess
 import logging
+import hashlib
 import sys
+import re
 import os
-import tempfile
-import shutil
-import requests
 import json
 from paths import YMU_APPDATA_DIR, LOCAL_VERSION
 
@@ -20,6 +20,95 @@ UPDATER_EXE_PATH = os.path.join(YMU_APPDATA_DIR, "ymu_self_updater.exe")
 _update_cache = {}
 CACHE_DURATION_SECONDS = 300
 
+# check_for_updates_async 的線程池，首次使用時才創建
+_executor = None
+
+# 跨進程重啟持久化更新檢查結果：5 分鐘內重新啟動就不用再打 GitHub API
+_CACHE_FILE = os.path.join(YMU_APPDATA_DIR, "update_cache.json")
+
+
+# GitHub /releases/latest 響應的 ETag，用於條件請求（304 不計入速率限制）
+_cached_etag = None
+
+# LOCAL_VERSION 是常量，Version 對象只在首次比較時構造一次
+# （放在函數裡惰性初始化，配合 packaging 的延遲導入）
+_local_version_parsed = None
+
+
+def _load_persistent_cache():
+    """模塊導入時預填 _update_cache；文件缺失或損壞則靜默忽略"""
+    global _cached_etag
+    try:
+        with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        status, payload = data["result"]
+        _update_cache[data["repo"]] = ((status, payload), data["timestamp"])
+        _cached_etag = data.get("etag")
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+
+def _save_persistent_cache(repo, result, timestamp, etag=None):
+    """原子寫入緩存文件（臨時文件 + os.replace）"""
+    temp_path = _CACHE_FILE + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"repo": repo, "result": list(result), "timestamp": timestamp, "etag": etag},
+                f,
+            )
+        os.replace(temp_path, _CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not persist update cache: {e}")
+
+
+_load_persistent_cache()
+
+# 所有 GitHub 請求共用一個帶連接池的 Session，
+# metadata GET 和資產下載之間可以復用 keep-alive 連接（省一次 TLS 握手）
+_SESSION = None
+
+
+def _get_session():
+    """首次使用時才導入 requests 並創建共享 Session"""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": "YMU-Updater",
+            "Accept": "application/vnd.github.v3+json",
+        })
+        # GitHub 滾動部署時偶發 429/5xx，指數退避重試比直接報網絡錯誤
+        # 對用戶友好；重試只在這些狀態碼上觸發，不拖慢正常路徑
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
+
+# (連接超時, 讀取超時)：連接 5 秒內建立不起來就是網絡有問題，
+# 不值得像讀取一樣等 30 秒
+_TIMEOUT = (5, 30)
+
+# 下載塊大小：1 MiB。8 KiB 會讓每個塊都經過一次 Python 迭代和寫入，
+# 多 MB 的 exe 下載時開銷主要在這裡而不是網絡
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 超過此大小的資產用多連接 Range 請求並行下載
+PARALLEL_DOWNLOAD_THRESHOLD = 4 * 1024 * 1024
+PARALLEL_DOWNLOAD_CONNECTIONS = 4
+
 # --- STATUS CONSTANTS ---
 STATUS_ERROR = "ERROR"
 STATUS_UPDATE_AVAILABLE = "UPDATE_AVAILABLE"
@@ -35,26 +124,43 @@ def check_for_updates(*args, **kwargs):
     import time
     from packaging.version import parse
 
+    global _cached_etag, _local_version_parsed
+
     current_time = time.time()
 
-    if REPO in _update_cache:
-        cached_data, timestamp = _update_cache[REPO]
+    cached_entry = _update_cache.get(REPO)
+    if cached_entry is not None:
+        cached_data, timestamp = cached_entry
         if (current_time - timestamp) < CACHE_DURATION_SECONDS:
             return cached_data
 
     logger.info("Checking for YMU updates...")
     try:
-        provider = release_service.GitHubAPIProvider(
-            repository=REPO, asset_extension=".exe"
-        )
-        latest_release = provider.get_latest_release()
+        api_url = f"https://api.github.com/repos/{REPO}/releases/latest"
 
-        if not latest_release:
-            return (STATUS_ERROR, "Could not fetch release info")
+        # 帶上 ETag 做條件請求：release 沒變時 GitHub 回 304 空 body
+        headers = {}
+        if _cached_etag and cached_entry is not None:
+            headers["If-None-Match"] = _cached_etag
+
+        response = _get_session().get(api_url, headers=headers, timeout=_TIMEOUT)
+
+        if response.status_code == 304 and cached_entry is not None:
+            # 沒有新 release：沿用緩存結果，只刷新時間戳
+            result = cached_entry[0]
+            _update_cache[REPO] = (result, current_time)
+            _save_persistent_cache(REPO, result, current_time, _cached_etag)
+            return result
+
+        response.raise_for_status()
 
-        remote_version = latest_release.version_tag
+        remote_version = response.json().get("tag_name")
+        if not remote_version:
+            return (STATUS_ERROR, "Could not fetch release info")
 
-        local = parse(LOCAL_VERSION)
+        if _local_version_parsed is None:
+            _local_version_parsed = parse(LOCAL_VERSION)
+        local = _local_version_parsed
         remote = parse(remote_version)
 
         result = None
@@ -65,7 +171,9 @@ def check_for_updates(*args, **kwargs):
         else:
             result = (STATUS_AHEAD, remote_version)
 
+        _cached_etag = response.headers.get("ETag")
         _update_cache[REPO] = (result, current_time)
+        _save_persistent_cache(REPO, result, current_time, _cached_etag)
         return result
 
     except Exception as e:
@@ -73,86 +181,288 @@ def check_for_updates(*args, **kwargs):
         return (STATUS_ERROR, str(e))
 
 
+def check_for_updates_async(callback):
+    """
+    非阻塞版本的更新檢查：把網絡請求丟到線程池，
+    完成後以 callback(status, data) 回調
+
+    注意：callback 在工作線程上執行。GUI 代碼請繼續通過
+    WorkerManager.run_task 調用同步的 check_for_updates，
+    以便結果經由 Qt 信號回到主線程
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2)
+
+    future = _executor.submit(check_for_updates)
+    future.add_done_callback(lambda f: callback(*f.result()))
+    return future
+
+
+# 記錄最近一次成功下載的資產元數據，用於「已是最新」時跳過重寫
+_UPDATER_META_FILE = UPDATER_EXE_PATH + ".meta.json"
+
+
+def _is_updater_current(asset) -> bool:
+    """磁盤上的 updater 與 release 資產一致時返回 True"""
+    try:
+        with open(_UPDATER_META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return (
+            meta.get("asset_id") == asset.get("id")
+            and meta.get("updated_at") == asset.get("updated_at")
+            and meta.get("size") == asset.get("size")
+            and os.path.getsize(UPDATER_EXE_PATH) == asset.get("size")
+        )
+    except (OSError, ValueError):
+        return False
+
+
+def _save_updater_meta(asset):
+    """下載成功後原子寫入資產元數據"""
+    temp_path = _UPDATER_META_FILE + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "asset_id": asset.get("id"),
+                    "size": asset.get("size"),
+                    "updated_at": asset.get("updated_at"),
+                },
+                f,
+            )
+        os.replace(temp_path, _UPDATER_META_FILE)
+    except OSError as e:
+        logger.warning(f"Could not persist updater metadata: {e}")
+
+
+def _download_ranges(asset_url, total_size, temp_path, progress_signal=None):
+    """
+    把資產切成 N 段用 Range 請求並行下載。各線程打開自己獨立的文件
+    對象，seek 到自己的偏移順序寫入——獨立文件對象在 POSIX 和 Windows
+    上都是安全的，不需要 os.pwrite。成功時返回文件開頭兩個字節（供
+    PE 標誌驗證），返回 None 表示需要回退到單流下載（例如服務器不回 206）
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        # 預先創建並擴展到總大小，提示文件系統一次性分配區段
+        with open(temp_path, "wb") as f:
+            f.truncate(total_size)
+
+        progress = {"downloaded": 0, "last_pct": -1}
+        progress_lock = threading.Lock()
+        # 首段線程順手截下開頭兩個字節，免得事後重開文件
+        magic = {}
+
+        def fetch_range(lo, hi):
+            resp = _get_session().get(
+                asset_url,
+                headers={"Range": f"bytes={lo}-{hi}"},
+                stream=True,
+                timeout=_TIMEOUT,
+            )
+            if resp.status_code != 206:
+                raise ValueError(f"Range request not honored (HTTP {resp.status_code})")
+            with open(temp_path, "r+b") as f:
+                f.seek(lo)
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        if lo == 0 and "bytes" not in magic:
+                            magic["bytes"] = bytes(chunk[:2])
+                        f.write(chunk)
+                        if progress_signal:
+                            with progress_lock:
+                                progress["downloaded"] += len(chunk)
+                                pct = progress["downloaded"] * 100 // total_size
+                                if pct != progress["last_pct"]:
+                                    progress_signal.emit(pct)
+                                    progress["last_pct"] = pct
+
+        part = total_size // PARALLEL_DOWNLOAD_CONNECTIONS
+        ranges = [
+            (i * part, (i + 1) * part - 1 if i < PARALLEL_DOWNLOAD_CONNECTIONS - 1 else total_size - 1)
+            for i in range(PARALLEL_DOWNLOAD_CONNECTIONS)
+        ]
+        with ThreadPoolExecutor(max_workers=PARALLEL_DOWNLOAD_CONNECTIONS) as pool:
+            for future in [pool.submit(fetch_range, lo, hi) for lo, hi in ranges]:
+                future.result()
+        return magic.get("bytes", b"")
+    except Exception as e:
+        logger.warning(f"Parallel range download failed, falling back to single stream: {e}")
+        return None
+
+
+def _expected_updater_sha256(release_data):
+    """從 release 說明裡提取 64 位十六進制 SHA-256
+    （與 release_service 解析 DLL 校驗和的約定相同）"""
+    match = re.search(r"\b[a-fA-F0-9]{64}\b", release_data.get("body") or "")
+    return match.group(0) if match else None
+
+
+def _sha256_of_file(path):
+    """計算文件的 SHA-256（並行下載亂序寫入，只能事後補讀一遍）"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _finalize_updater_download(temp_path, asset, magic, downloaded, sha256_hex, expected_sha256):
+    """驗證下載結果（基於剛寫入的字節，無需重新打開文件）、
+    替換原文件並記錄資產元數據"""
+    if downloaded < 1024:
+        os.remove(temp_path)
+        return False, f"Updater file is too small: {downloaded} bytes"
+
+    if magic != b"MZ":
+        os.remove(temp_path)
+        return False, "Downloaded file is not a valid Windows executable"
+
+    if expected_sha256:
+        if sha256_hex is None:
+            sha256_hex = _sha256_of_file(temp_path)
+        if sha256_hex.lower() != expected_sha256.lower():
+            os.remove(temp_path)
+            logger.error(
+                f"Updater checksum mismatch: expected {expected_sha256}, got {sha256_hex}"
+            )
+            return False, "checksum mismatch"
+        logger.info("Updater checksum verified")
+    else:
+        logger.warning("No remote checksum in release notes. Skipping integrity check.")
+
+    # os.replace 在 POSIX 和 Windows 上都是原子重命名，
+    # 不會像 remove+move 那樣留下一個沒有 updater 的窗口
+    os.replace(temp_path, UPDATER_EXE_PATH)
+
+    _save_updater_meta(asset)
+    logger.info(f"Updater downloaded successfully: {UPDATER_EXE_PATH} ({downloaded} bytes)")
+    return True, "Updater downloaded successfully"
+
+
+def _discard_temp(temp_path):
+    """刪除失敗下載留下的臨時文件（mkstemp 的唯一命名不會被下次下載覆蓋）"""
+    if temp_path is not None:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 def download_updater_directly(progress_signal=None):
     """
     直接從 GitHub 下載 updater，不使用 release_service
     """
     logger.info(f"Directly downloading updater from {UPDATER_REPO}")
-    
+
+    import requests
+    import tempfile
+
+    temp_path = None
     try:
-        # 直接獲取 latest 發布的信息
+        # 直接獲取 latest 發布的信息（User-Agent 等頭部已設在 _SESSION 上）
         api_url = f"https://api.github.com/repos/{UPDATER_REPO}/releases/latest"
-        
-        # 添加 User-Agent 頭部
-        headers = {
-            "User-Agent": "YMU-Updater",
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
-        response = requests.get(api_url, headers=headers, timeout=30)
+
+        response = _get_session().get(api_url, timeout=_TIMEOUT)
         response.raise_for_status()
         
         release_data = response.json()
         
         # 尋找 ymu_self_updater.exe
-        asset_url = None
-        for asset in release_data.get("assets", []):
-            if asset["name"] == "ymu_self_updater.exe":
-                asset_url = asset["browser_download_url"]
-                break
-        
-        if not asset_url:
+        assets = release_data.get("assets", [])
+        asset = next((a for a in assets if a["name"] == "ymu_self_updater.exe"), None)
+
+        if asset is None:
             # 如果沒有找到，嘗試下載第一個 asset
-            if release_data.get("assets"):
-                asset_url = release_data["assets"][0]["browser_download_url"]
+            if assets:
+                asset = assets[0]
             else:
                 return False, "No assets found in the latest release"
-        
-        # 下載文件
+
+        asset_url = asset["browser_download_url"]
+
+        # 磁盤上的 updater 已經是這個資產時直接短路，省掉多 MB 的下載
+        if _is_updater_current(asset):
+            logger.info("Updater on disk already matches the latest release")
+            return True, "Updater already up to date (cached)"
+
+        # 下載到唯一命名的臨時文件：兩次啟動碰巧同時下載時，
+        # 固定的 .tmp 後綴會互相覆蓋半成品
+        tmp_fd, temp_path = tempfile.mkstemp(
+            prefix="ymu_self_updater.", suffix=".tmp", dir=YMU_APPDATA_DIR
+        )
+        os.close(tmp_fd)
+        asset_size = asset.get("size", 0)
+        expected_sha256 = _expected_updater_sha256(release_data)
+
+        # 足夠大的資產先嘗試多連接 Range 下載，失敗則回退單流
+        if asset_size > PARALLEL_DOWNLOAD_THRESHOLD:
+            magic = _download_ranges(asset_url, asset_size, temp_path, progress_signal)
+            if magic is not None:
+                logger.info(f"Downloaded updater via {PARALLEL_DOWNLOAD_CONNECTIONS} parallel ranges")
+                return _finalize_updater_download(
+                    temp_path, asset, magic, asset_size, None, expected_sha256
+                )
+
+        # 下載文件（單流）
         logger.info(f"Downloading updater from: {asset_url}")
-        download_response = requests.get(asset_url, headers=headers, stream=True, timeout=60)
+        download_response = _get_session().get(asset_url, stream=True, timeout=_TIMEOUT)
         download_response.raise_for_status()
-        
-        # 獲取文件總大小
-        total_size = int(download_response.headers.get('content-length', 0))
-        
-        # 下載到臨時文件
-        temp_path = UPDATER_EXE_PATH + ".tmp"
-        
-        with open(temp_path, 'wb') as f:
+
+        # 獲取文件總大小；重定向後可能沒有 content-length，
+        # 這時退回 release JSON 裡的資產大小，保證預分配和進度條仍然工作
+        total_size = int(download_response.headers.get('content-length', 0)) or asset_size
+
+        # 原始 fd 寫入：塊本身已是 1 MiB，繞過 BufferedWriter 的一層拷貝；
+        # 預先 ftruncate 到總大小，提示文件系統一次性分配區段
+        fd = os.open(
+            temp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        )
+        try:
+            if total_size > 0:
+                os.ftruncate(fd, total_size)
+
             downloaded = 0
-            for chunk in download_response.iter_content(chunk_size=8192):
+            last_pct = -1
+            magic = b""
+            # 邊下邊哈希：字節還在 CPU 緩存裡，幾乎零額外開銷
+            h = hashlib.sha256()
+            for chunk in download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 if chunk:
-                    f.write(chunk)
+                    # 順手截下開頭兩個字節做 PE 標誌驗證，免得事後重開文件
+                    if not magic:
+                        magic = bytes(chunk[:2])
+                    os.write(fd, chunk)
+                    h.update(chunk)
                     downloaded += len(chunk)
-                    
-                    # 更新進度（如果提供了信號）
+
+                    # 更新進度（如果提供了信號）：只在整數百分比變化時才
+                    # 發射，避免重複的跨線程信號轟炸 GUI
                     if progress_signal and total_size > 0:
-                        progress = int((downloaded / total_size) * 100)
-                        progress_signal.emit(progress)
-        
-        # 下載完成後替換原文件
-        if os.path.exists(UPDATER_EXE_PATH):
-            os.remove(UPDATER_EXE_PATH)
-        
-        shutil.move(temp_path, UPDATER_EXE_PATH)
-        
-        # 驗證文件
-        if not os.path.exists(UPDATER_EXE_PATH):
-            return False, "Downloaded file not found"
-        
-        file_size = os.path.getsize(UPDATER_EXE_PATH)
-        if file_size == 0:
-            return False, "Downloaded file is empty"
-        
-        logger.info(f"Updater downloaded successfully: {UPDATER_EXE_PATH} ({file_size} bytes)")
-        return True, "Updater downloaded successfully"
-        
+                        pct = downloaded * 100 // total_size
+                        if pct != last_pct:
+                            progress_signal.emit(pct)
+                            last_pct = pct
+        finally:
+            os.close(fd)
+
+        return _finalize_updater_download(
+            temp_path, asset, magic, downloaded, h.hexdigest(), expected_sha256
+        )
+
     except requests.RequestException as e:
         logger.exception(f"Failed to download updater: {e}")
+        _discard_temp(temp_path)
         return False, f"Network error: {str(e)}"
     except Exception as e:
         logger.exception(f"Unexpected error downloading updater: {e}")
+        _discard_temp(temp_path)
         return False, f"Download error: {str(e)}"
 
 
@@ -161,97 +471,51 @@ def download_and_launch_updater(progress_signal=None, *args, **kwargs):
     Downloads updater, passes sys.executable to it.
     """
     logger.info(f"Downloading and launching updater from {UPDATER_REPO}")
-    
-    # 先嘗試使用 release_service，如果失敗則使用直接下載
-    use_direct_download = True  # 設置為 True 直接使用我們的新方法
-    
-    if not use_direct_download:
-        try:
-            logger.info("Attempting to download updater via release_service...")
-            provider = release_service.GitHubAPIProvider(
-                repository=UPDATER_REPO, asset_extension=".exe"
-            )
-            latest_release = provider.get_latest_release()
 
-            if not latest_release:
-                logger.warning("release_service failed, using direct download...")
-                success, message = download_updater_directly(progress_signal)
-            else:
-                success = release_service.download_and_verify_release(
-                    latest_release, progress_signal
-                )
-                message = "Downloaded via release_service" if success else "Failed via release_service"
-        except Exception as e:
-            logger.warning(f"release_service error: {e}, using direct download...")
-            success, message = download_updater_directly(progress_signal)
-    else:
-        # 直接使用我們的新方法
-        success, message = download_updater_directly(progress_signal)
+    success, message = download_updater_directly(progress_signal)
 
     if not success:
         return (False, message)
 
-    # 驗證文件
-    if not os.path.exists(UPDATER_EXE_PATH):
-        return (False, f"Updater file not found at: {UPDATER_EXE_PATH}")
-    
-    if os.path.getsize(UPDATER_EXE_PATH) < 1024:
-        return (False, f"Updater file is too small: {os.path.getsize(UPDATER_EXE_PATH)} bytes")
-    
-    logger.info(f"Verifying updater file: {UPDATER_EXE_PATH}")
-    
-    # 在 Windows 上檢查 PE 文件標誌
-    if sys.platform == "win32":
-        try:
-            with open(UPDATER_EXE_PATH, 'rb') as f:
-                header = f.read(2)
-                if header != b'MZ':
-                    return (False, "Downloaded file is not a valid Windows executable")
-        except Exception as e:
-            logger.warning(f"Could not verify PE header: {e}")
+    # 大小和 PE 標誌已在下載流程中對剛寫入的字節驗證過，
+    # 這裡不再重新打開文件檢查
 
     try:
         logger.info(f"Launching updater: {UPDATER_EXE_PATH}")
         current_exe = sys.executable
-        
-        # 確保當前執行文件路徑正確
-        if not os.path.exists(current_exe):
+
+        # 確保當前執行文件路徑正確；每個路徑只 stat 一次，
+        # 結果留給下面的錯誤報告復用
+        current_exe_exists = os.path.exists(current_exe)
+        if not current_exe_exists:
             logger.warning(f"sys.executable not found: {current_exe}")
             # 嘗試使用 argv[0]
             if os.path.exists(sys.argv[0]):
                 current_exe = sys.argv[0]
+                current_exe_exists = True
                 logger.info(f"Using sys.argv[0] instead: {current_exe}")
-        
+
         cmd = [UPDATER_EXE_PATH, current_exe]
         logger.info(f"Command: {cmd}")
         
         # 啟動 updater
         if sys.platform == "win32":
-            # 在 Windows 上使用多種方式嘗試
-            try:
-                # 方法1: 使用 DETACHED_PROCESS
-                subprocess.Popen(
-                    cmd,
-                    creationflags=subprocess.DETACHED_PROCESS,
-                    close_fds=True,
-                )
-            except Exception as e1:
-                logger.warning(f"Method 1 failed: {e1}, trying method 2...")
-                try:
-                    # 方法2: 使用 CREATE_NO_WINDOW
-                    CREATE_NO_WINDOW = 0x08000000
-                    subprocess.Popen(
-                        cmd,
-                        creationflags=CREATE_NO_WINDOW,
-                    )
-                except Exception as e2:
-                    logger.warning(f"Method 2 failed: {e2}, trying method 3...")
-                    try:
-                        # 方法3: 簡單啟動
-                        subprocess.Popen(cmd)
-                    except Exception as e3:
-                        logger.error(f"All methods failed: {e3}")
-                        raise
+            # 三個 creationflags 並不互斥，一次 CreateProcess 就能同時做到
+            # 脫離父進程、獨立進程組、不彈控制台窗口；
+            # 標準流指向 DEVNULL，避免子進程繼承父進程的控制台句柄
+            CREATE_NO_WINDOW = 0x08000000
+            subprocess.Popen(
+                cmd,
+                creationflags=(
+                    subprocess.DETACHED_PROCESS
+                    | subprocess.CREATE_NEW_PROCESS_GROUP
+                    | CREATE_NO_WINDOW
+                ),
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
         else:
             # 非 Windows 系統
             subprocess.Popen(cmd)
@@ -262,15 +526,20 @@ def download_and_launch_updater(progress_signal=None, *args, **kwargs):
     except Exception as e:
         logger.exception(f"Failed to launch updater: {e}")
         
-        # 提供詳細的錯誤信息
+        # 提供詳細的錯誤信息；一次 os.stat 同時拿到「是否存在」和大小
+        try:
+            updater_size = os.stat(UPDATER_EXE_PATH).st_size
+        except OSError:
+            updater_size = None
+
         error_details = f"Failed to launch updater: {str(e)}\n"
         error_details += f"Updater path: {UPDATER_EXE_PATH}\n"
-        error_details += f"File exists: {os.path.exists(UPDATER_EXE_PATH)}\n"
-        if os.path.exists(UPDATER_EXE_PATH):
-            error_details += f"File size: {os.path.getsize(UPDATER_EXE_PATH)} bytes\n"
+        error_details += f"File exists: {updater_size is not None}\n"
+        if updater_size is not None:
+            error_details += f"File size: {updater_size} bytes\n"
         error_details += f"Current exe: {current_exe}\n"
-        error_details += f"Current exe exists: {os.path.exists(current_exe)}"
-        
+        error_details += f"Current exe exists: {current_exe_exists}"
+
         return (False, error_details)
 
 